@@ -1,13 +1,92 @@
-from typing import List
+import re
+import warnings
+from typing import Iterator, List, Tuple
 
+# Above this size a single chunk's output dominates per-call decode latency.
+# Output tokens are generated one at a time, so bundling K chunks into one
+# request costs roughly K times the decode time, whereas K separate requests
+# can run concurrently and finish in about the time of the slowest one.
+LARGE_CHUNK_WARN_WORDS = 400
 
-def chunk_text(
+# A word is any run of non-whitespace characters, matching str.split()
+_WORD_RE = re.compile(r"\S+")
+
+
+def _window_indices(
+    n_tokens: int,
+    max_words: int,
+    overlap: int,
+) -> List[Tuple[int, int]]:
+    """
+    Compute (start, end) word indices of each sliding window.
+
+    Only integer arithmetic per window is needed, so the cost depends on
+    the number of chunks rather than the number of words.
+    """
+    step = max_words - overlap
+    return [
+        (start, min(start + max_words, n_tokens))
+        for start in range(0, n_tokens, step)
+    ]
+
+
+def _warn_if_large_chunks(max_words: int) -> None:
+    """
+    Warn when max_words is above LARGE_CHUNK_WARN_WORDS.
+
+    Must be called directly from a public chunking function, so that
+    stacklevel=3 points the warning at that function's caller.
+    """
+    if max_words > LARGE_CHUNK_WARN_WORDS:
+        warnings.warn(
+            "Large chunks increase per-call decode latency; "
+            "prefer smaller chunks + asyncio.gather",
+            UserWarning,
+            stacklevel=3,
+        )
+
+
+def _generate_chunks(
+    text: str,
+    max_words: int,
+    overlap: int,
+) -> Iterator[str]:
+    """
+    Generator behind iter_chunks and chunk_text.
+    """
+    # Record the (start, end) offset of every word instead of copying
+    # the words out, so each chunk can be sliced straight from the text
+    spans = [(m.start(), m.end()) for m in _WORD_RE.finditer(text)]
+
+    # If the document is empty, there are no chunks
+    if not spans:
+        return
+
+    # Each chunk needs at least one word, otherwise the slices are empty
+    if max_words < 1:
+        raise ValueError("max_words must be at least 1")
+
+    # Overlap must be smaller than the chunk size to make progress
+    if overlap >= max_words:
+        raise ValueError("overlap must be smaller than max_words")
+
+    # Slice from the first character of the first word to the last
+    # character of the last word, so each chunk is already stripped
+    for start, end in _window_indices(len(spans), max_words, overlap):
+        yield text[spans[start][0]:spans[end - 1][1]]
+
+
+def iter_chunks(
     text: str,
     max_words: int = 250,
     overlap: int = 50,
-) -> List[str]:
+) -> Iterator[str]:
     """
-    Split a long text into overlapping chunks based on word count.
+    Lazily split a long text into overlapping chunks based on word count.
+
+    Word offsets are found up front, but chunks are sliced and yielded
+    one at a time, so extraction.extract_all_chunks can start the request
+    for the first chunk before later chunks are produced.
 
     Parameters
     ----------
@@ -19,46 +98,61 @@ def chunk_text(
         Number of words that overlap between consecutive chunks.
         Default is 50.
 
-    Returns
-    -------
-    List[str]
-        A list of text chunks. Each chunk is a string containing
-        up to max_words words, with overlap between neighbours.
+    Yields
+    ------
+    str
+        A slice of the original text containing up to max_words words,
+        with overlap between neighbours. Whitespace inside a chunk is
+        kept as in the source.
 
     Raises
     ------
     ValueError
-        If overlap is greater than or equal to max_words.
-    """
-    # Split the text into a list of words using whitespace
-    words = text.split()
-
-    # If the document is empty, return an empty list of chunks
-    if not words:
-        return []
-
-    # Overlap must be smaller than the chunk size to make progress
-    if overlap >= max_words:
-        raise ValueError("overlap must be smaller than max_words")
+        If max_words is less than 1, or overlap is greater than or
+        equal to max_words. This is raised when iteration starts.
 
-    chunks: List[str] = []
-    start = 0
+    Notes
+    -----
+    Each chunk is meant to be sent in its own LLM request. Prefer more,
+    smaller chunks run concurrently (see extraction.extract_all_chunks)
+    over fewer large ones or concatenating chunks into one prompt.
+    """
+    _warn_if_large_chunks(max_words)
+    return _generate_chunks(text, max_words, overlap)
 
-    # Slide a window over the list of words
-    while start < len(words):
-        end = start + max_words
 
-        # Select the slice of words for this chunk
-        chunk_words = words[start:end]
+def chunk_text(
+    text: str,
+    max_words: int = 250,
+    overlap: int = 50,
+) -> List[str]:
+    """
+    Split a long text into overlapping chunks based on word count.
 
-        # Join the words back into a string
-        chunk_text_str = " ".join(chunk_words).strip()
+    This is the list form of iter_chunks.
 
-        # Only append non empty chunks
-        if chunk_text_str:
-            chunks.append(chunk_text_str)
+    Parameters
+    ----------
+    text : str
+        The full document text as a single string.
+    max_words : int, optional
+        Maximum number of words in each chunk. Default is 250.
+    overlap : int, optional
+        Number of words that overlap between consecutive chunks.
+        Default is 50.
 
-        # Move the start index forward, keeping the desired overlap
-        start = start + max_words - overlap
+    Returns
+    -------
+    List[str]
+        A list of text chunks. Each chunk is a slice of the original
+        text containing up to max_words words, with overlap between
+        neighbours. Whitespace inside a chunk is kept as in the source.
 
-    return chunks
+    Raises
+    ------
+    ValueError
+        If max_words is less than 1, or overlap is greater than or
+        equal to max_words.
+    """
+    _warn_if_large_chunks(max_words)
+    return list(_generate_chunks(text, max_words, overlap))
@@ -1,20 +1,143 @@
 # src/extraction.py
 import os
-import json
-from typing import Optional, Dict
+import time
+import random
+import asyncio
+from hashlib import blake2b
+from typing import Optional, Dict, Iterable, List, Tuple
 
 from dotenv import load_dotenv
-from groq import Groq
+from groq import (
+    Groq,
+    AsyncGroq,
+    APIConnectionError,
+    AuthenticationError,
+    InternalServerError,
+    RateLimitError,
+)
+
+# orjson parses LLM output noticeably faster, but is optional
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 from .validation import validate_extracted_json
-from .prompt_template import build_prompt
+from .prompt_template import build_prompt_fast
 
 
 # Load environment variables (API key)
 load_dotenv()
 
-# Create Groq client once (efficient)
+# Create Groq clients once (efficient)
 client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+aclient = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
+
+# Cache of validated results keyed by a hash of the chunk text, so repeated
+# boilerplate chunks (headers, disclaimers) skip the LLM call entirely.
+# Oldest entries are evicted first once the cap is reached.
+_CHUNK_CACHE_MAX_SIZE = 4096
+_CHUNK_CACHE: Dict[bytes, Dict] = {}
+
+
+def _chunk_cache_key(chunk_text: str) -> bytes:
+    return blake2b(chunk_text.encode("utf-8"), digest_size=16).digest()
+
+
+def _copy_result(value: Optional[Dict]) -> Optional[Dict]:
+    """
+    Copy an extraction result so callers can modify it (e.g. add doc
+    metadata) without changing the cached entry. The risk factor list
+    is the only mutable value, so it is copied too.
+    """
+    if value is None:
+        return None
+    copied = dict(value)
+    copied["key_risk_factors"] = list(copied["key_risk_factors"])
+    return copied
+
+
+def _chunk_cache_put(key: bytes, value: Dict) -> None:
+    if len(_CHUNK_CACHE) >= _CHUNK_CACHE_MAX_SIZE:
+        # Dicts keep insertion order, so the first key is the oldest
+        del _CHUNK_CACHE[next(iter(_CHUNK_CACHE))]
+    _CHUNK_CACHE[key] = _copy_result(value)
+
+
+# Errors worth retrying: rate limits and network or server hiccups.
+# JSON mode constrains the output to valid JSON, so parse errors are
+# not retried.
+_RETRYABLE_ERRORS = (
+    RateLimitError,
+    APIConnectionError,
+    InternalServerError,
+)
+
+# Upper bound on the wait between retries, in seconds
+_MAX_BACKOFF_SECONDS = 30.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with jitter, so concurrent callers that hit a
+    rate limit together do not all retry at the same moment.
+    """
+    return min(2 ** attempt + random.random(), _MAX_BACKOFF_SECONDS)
+
+
+# Request settings shared by the sync and async calls
+_COMPLETION_KWARGS = {
+    "model": "llama-3.1-8b-instant",
+    "temperature": 0,
+    "response_format": {"type": "json_object"},
+}
+
+
+def _prepare(chunk_text: str) -> Tuple[bytes, Optional[Dict], List[Dict[str, str]]]:
+    """
+    Look up the chunk in the cache and build the chat messages.
+
+    Returns the cache key, a copy of the cached result (or None on a miss)
+    and the message list, which is built once and reused across retries.
+    """
+    key = _chunk_cache_key(chunk_text)
+    cached = _copy_result(_CHUNK_CACHE.get(key))
+    messages = [{"role": "user", "content": build_prompt_fast(chunk_text)}]
+    return key, cached, messages
+
+
+def _parse_and_cache(content: str, key: bytes) -> Optional[Dict]:
+    """
+    Parse and validate the LLM output, caching it if valid.
+    """
+    # Attempt to parse JSON
+    data = _json.loads(content)
+
+    # Validate JSON structure and controlled vocabularies
+    validated = validate_extracted_json(data)
+    if validated is not None:
+        _chunk_cache_put(key, validated)
+    return validated
+
+
+def _should_retry(error: Exception, attempt: int) -> bool:
+    """
+    Decide what to do with an error raised during an extraction attempt.
+
+    Returns True if the attempt is worth retrying and False if the chunk
+    should be given up on. Authentication errors are re-raised, since a
+    bad API key will fail on every chunk.
+    """
+    if isinstance(error, AuthenticationError):
+        raise error
+
+    if isinstance(error, _RETRYABLE_ERRORS):
+        print(f"Attempt {attempt + 1}: Error during extraction: {error}")
+        return True
+
+    # Anything else (e.g. a bad request or bad JSON) will not succeed on retry
+    print(f"Attempt {attempt + 1}: Error during extraction or parsing: {error}")
+    return False
 
 
 def call_llm_on_chunk(chunk_text: str, max_retries: int = 1) -> Optional[Dict]:
@@ -24,9 +147,11 @@ def call_llm_on_chunk(chunk_text: str, max_retries: int = 1) -> Optional[Dict]:
     Parameters
     ----------
     chunk_text : str
-        A single text chunk from the document.
+        A single text chunk from the document, as produced by the
+        chunker (already stripped of surrounding whitespace).
     max_retries : int, optional
-        How many times to retry if JSON parsing fails.
+        How many times to retry after a rate limit, connection or
+        server error. Parse and validation failures are not retried.
 
     Returns
     -------
@@ -34,34 +159,126 @@ def call_llm_on_chunk(chunk_text: str, max_retries: int = 1) -> Optional[Dict]:
         A validated dictionary matching the JSON schema,
         or None if extraction fails.
     """
+    key, cached, messages = _prepare(chunk_text)
+    if cached is not None:
+        return cached
 
-    # Build the final prompt with the chunk text inserted
-    prompt = build_prompt(chunk_text)
-
-    # Try extraction up to max_retries times
+    # Try extraction up to max_retries times, backing off between attempts
     for attempt in range(max_retries + 1):
         try:
             response = client.chat.completions.create(
-                model="llama-3.1-8b-instant",
-                messages=[
-                    {"role": "system", "content": "You are a JSON extraction assistant."},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0
+                messages=messages, **_COMPLETION_KWARGS
             )
+            return _parse_and_cache(response.choices[0].message.content, key)
+
+        except Exception as e:
+            if not _should_retry(e, attempt):
+                return None
+            if attempt < max_retries:
+                time.sleep(_backoff_delay(attempt))
+
+    # If we reach this point, all retries failed
+    return None
 
-            # Extract content string from LLM
-            content = response.choices[0].message.content
 
-            # Attempt to parse JSON
-            data = json.loads(content)
+async def call_llm_on_chunk_async(chunk_text: str, max_retries: int = 1) -> Optional[Dict]:
+    """
+    Async version of call_llm_on_chunk using the AsyncGroq client.
 
-            # Validate JSON structure and controlled vocabularies
-            validated = validate_extracted_json(data)
-            return validated
+    Parameters
+    ----------
+    chunk_text : str
+        A single text chunk from the document, as produced by the
+        chunker (already stripped of surrounding whitespace).
+    max_retries : int, optional
+        How many times to retry after a rate limit, connection or
+        server error. Parse and validation failures are not retried.
+
+    Returns
+    -------
+    dict or None
+        A validated dictionary matching the JSON schema,
+        or None if extraction fails.
+    """
+    key, cached, messages = _prepare(chunk_text)
+    if cached is not None:
+        return cached
+
+    # Try extraction up to max_retries times, backing off between attempts
+    for attempt in range(max_retries + 1):
+        try:
+            response = await aclient.chat.completions.create(
+                messages=messages, **_COMPLETION_KWARGS
+            )
+            return _parse_and_cache(response.choices[0].message.content, key)
 
         except Exception as e:
-            print(f"Attempt {attempt + 1}: Error during extraction or parsing: {e}")
+            if not _should_retry(e, attempt):
+                return None
+            if attempt < max_retries:
+                await asyncio.sleep(_backoff_delay(attempt))
 
     # If we reach this point, all retries failed
     return None
+
+
+async def extract_all_chunks(
+    chunks: Iterable[str],
+    concurrency: int = 16,
+    max_retries: int = 1,
+) -> List[Optional[Dict]]:
+    """
+    Run extraction on many chunks concurrently.
+
+    Requests are I/O bound, so sending them together means a document
+    takes roughly as long as its slowest chunk instead of the sum of all
+    chunks. A semaphore caps the number of requests in flight, and
+    duplicate chunks are only sent once.
+
+    Parameters
+    ----------
+    chunks : Iterable[str]
+        Text chunks from one or more documents, e.g. a list from
+        chunk_text or a generator from iter_chunks. A request is
+        started for each chunk as soon as it is produced.
+    concurrency : int, optional
+        Maximum number of requests in flight at once. Default is 16.
+    max_retries : int, optional
+        Passed through to call_llm_on_chunk_async.
+
+    Returns
+    -------
+    List[dict or None]
+        One result per chunk, in the same order as the input.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(chunk: str) -> Optional[Dict]:
+        async with sem:
+            return await call_llm_on_chunk_async(chunk, max_retries=max_retries)
+
+    # Start one task per distinct chunk as soon as it arrives, so with a
+    # generator such as iter_chunks the first requests are already in
+    # flight while later chunks are produced. Identical chunks in the
+    # same batch would all miss the cache, since it is only filled once a
+    # call completes, so each distinct chunk is sent only once.
+    keys: List[bytes] = []
+    tasks: Dict[bytes, asyncio.Task] = {}
+    try:
+        for chunk in chunks:
+            key = _chunk_cache_key(chunk)
+            keys.append(key)
+            if key not in tasks:
+                tasks[key] = asyncio.ensure_future(one(chunk))
+                # Let the new task send its request before taking the next chunk
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        # Don't leave requests running if chunking or a request fails
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    # Give every position its own copy of the shared result
+    return [_copy_result(tasks[key].result()) for key in keys]
@@ -9,6 +9,7 @@ from .validation import (
 )
 
 PROMPT_TEMPLATE = """
+Return JSON only.
 You are an AI assistant that extracts structured risk information from insurance related text.
 
 Your task:
@@ -37,6 +38,14 @@ Document chunk:
 {chunk_text}
 """.strip()
 
+# Everything before {chunk_text} is fixed, so fill it in once at import time.
+# The chunk text is the last thing in the template, so there is no suffix.
+_PROMPT_PREFIX = PROMPT_TEMPLATE.split("{chunk_text}")[0].format(
+    allowed_regions=", ".join(ALLOWED_REGIONS),
+    allowed_risk_types=", ".join(ALLOWED_RISK_TYPES),
+    allowed_time_horizons=", ".join(ALLOWED_TIME_HORIZONS),
+)
+
 
 def build_prompt(chunk_text: str) -> str:
     """
@@ -53,9 +62,24 @@ def build_prompt(chunk_text: str) -> str:
     str
         The final prompt to send to the LLM.
     """
-    return PROMPT_TEMPLATE.format(
-        allowed_regions=", ".join(ALLOWED_REGIONS),
-        allowed_risk_types=", ".join(ALLOWED_RISK_TYPES),
-        allowed_time_horizons=", ".join(ALLOWED_TIME_HORIZONS),
-        chunk_text=chunk_text.strip(),
-    )
+    return _PROMPT_PREFIX + chunk_text.strip()
+
+
+def build_prompt_fast(chunk_text: str) -> str:
+    """
+    Build the LLM prompt for a chunk that is already stripped.
+
+    Chunks from chunking.chunk_text / iter_chunks never have leading or
+    trailing whitespace, so the strip in build_prompt can be skipped.
+
+    Parameters
+    ----------
+    chunk_text : str
+        The text of a single chunk, without surrounding whitespace.
+
+    Returns
+    -------
+    str
+        The final prompt to send to the LLM.
+    """
+    return _PROMPT_PREFIX + chunk_text
@@ -15,10 +15,14 @@ This module assumes that:
   }
 
 The goal is to combine many chunk-level dicts into a single document-level dict.
+reduce_extractions_for_corpus applies the same rules to many documents at once
+using pandas.
 """
 
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
-from collections import Counter
+
+import pandas as pd
 
 from .validation import (
     ALLOWED_RISK_TYPES,
@@ -27,15 +31,11 @@ from .validation import (
 )
 
 
-def _clean_str(value: Any) -> str:
-    """
-    Safely convert a value to a stripped string.
-    Returns an empty string if the value is not a string or is blank.
-    """
-    if not isinstance(value, str):
-        return ""
-    cleaned = value.strip()
-    return cleaned if cleaned else ""
+# Lowercased value -> canonical value for each controlled vocabulary.
+# Built once at import and read-only, since the vocabularies never change.
+_RISK_TYPE_CANON = MappingProxyType({v.lower(): v for v in ALLOWED_RISK_TYPES})
+_REGION_CANON = MappingProxyType({v.lower(): v for v in ALLOWED_REGIONS})
+_TIME_HORIZON_CANON = MappingProxyType({v.lower(): v for v in ALLOWED_TIME_HORIZONS})
 
 
 def _choose_most_frequent_non_empty(values: List[str]) -> str:
@@ -44,15 +44,20 @@ def _choose_most_frequent_non_empty(values: List[str]) -> str:
 
     If all values are empty strings, returns an empty string.
     """
-    cleaned = [_clean_str(v) for v in values]
-    cleaned = [v for v in cleaned if v]
+    counts: Dict[str, int] = {}
+    for value in values:
+        if not isinstance(value, str):
+            continue
+        value = value.strip()
+        if not value:
+            continue
+        counts[value] = counts.get(value, 0) + 1
 
-    if not cleaned:
+    if not counts:
         return ""
 
-    counts = Counter(cleaned)
-    most_common_value, _ = counts.most_common(1)[0]
-    return most_common_value
+    # Dicts keep insertion order, so ties go to the value seen first
+    return max(counts, key=counts.get)
 
 
 def _merge_lists_unique(list_of_lists: List[List[str]]) -> List[str]:
@@ -63,23 +68,21 @@ def _merge_lists_unique(list_of_lists: List[List[str]]) -> List[str]:
     Uniqueness is checked in a case-insensitive way, but the original
     casing of the first occurrence is preserved.
     """
-    seen_lower = set()
-    merged: List[str] = []
+    # Maps lowercased key -> first cased occurrence, in insertion order
+    seen: Dict[str, str] = {}
 
     for items in list_of_lists:
         if not isinstance(items, list):
             continue
         for item in items:
-            cleaned = _clean_str(item)
-            if not cleaned:
+            if not isinstance(item, str):
                 continue
-            key_lower = cleaned.lower()
-            if key_lower in seen_lower:
+            cleaned = item.strip()
+            if not cleaned:
                 continue
-            seen_lower.add(key_lower)
-            merged.append(cleaned)
+            seen.setdefault(cleaned.lower(), cleaned)
 
-    return merged
+    return list(seen.values())
 
 
 def _concat_summaries(summaries: List[str], max_chars: int = 800) -> str:
@@ -89,18 +92,36 @@ def _concat_summaries(summaries: List[str], max_chars: int = 800) -> str:
     The result is truncated to at most max_chars characters to avoid
     extremely long text.
     """
-    cleaned = [_clean_str(s) for s in summaries]
-    cleaned = [s for s in cleaned if s]
+    # Build the result piece by piece and stop once max_chars is reached,
+    # rather than joining every summary and slicing most of it away
+    parts: List[str] = []
+    total = 0
+    truncated = False
+
+    for summary in summaries:
+        if not isinstance(summary, str):
+            continue
+        summary = summary.strip()
+        if not summary:
+            continue
 
-    if not cleaned:
+        sep = 1 if parts else 0
+        if total + sep + len(summary) > max_chars:
+            parts.append(summary[:max(max_chars - total - sep, 0)])
+            truncated = True
+            break
+
+        parts.append(summary)
+        total += sep + len(summary)
+
+    if not parts:
         return ""
 
-    combined = " ".join(cleaned)
+    combined = " ".join(parts)
 
-    if len(combined) > max_chars:
-        combined = combined[:max_chars].rstrip()
-        # Optional: add an ellipsis to indicate truncation
-        combined = combined + " ..."
+    if truncated:
+        # Add an ellipsis to indicate truncation
+        combined = combined.rstrip() + " ..."
 
     return combined
 
@@ -177,26 +198,22 @@ def reduce_extractions_for_document(
     # For controlled vocab fields, choose the most frequent valid value.
     # Comparison is done in a case-insensitive way, but output uses
     # the canonical value from the allowed lists.
-    allowed_risk_types_lower = {v.lower(): v for v in ALLOWED_RISK_TYPES}
-    allowed_regions_lower = {v.lower(): v for v in ALLOWED_REGIONS}
-    allowed_time_horizons_lower = {v.lower(): v for v in ALLOWED_TIME_HORIZONS}
-
     risk_type_candidate = _choose_most_frequent_non_empty(risk_types)
     risk_type_key = risk_type_candidate.lower()
     risk_type = (
-        allowed_risk_types_lower.get(risk_type_key, "other")
+        _RISK_TYPE_CANON.get(risk_type_key, "other")
     )
 
     region_candidate = _choose_most_frequent_non_empty(regions)
     region_key = region_candidate.lower()
     region = (
-        allowed_regions_lower.get(region_key, "global")
+        _REGION_CANON.get(region_key, "global")
     )
 
     time_horizon_candidate = _choose_most_frequent_non_empty(time_horizons)
     time_horizon_key = time_horizon_candidate.lower()
     time_horizon = (
-        allowed_time_horizons_lower.get(time_horizon_key, "not_specified")
+        _TIME_HORIZON_CANON.get(time_horizon_key, "not_specified")
     )
 
     # Aggregate list and summary fields
@@ -219,3 +236,114 @@ def reduce_extractions_for_document(
         doc_level.update(doc_metadata)
 
     return doc_level
+
+
+def _most_frequent_per_doc(df: pd.DataFrame, col: str) -> pd.Series:
+    """
+    Vectorised _choose_most_frequent_non_empty over every document.
+
+    Returns a Series indexed by doc_id. Ties go to the value that appears
+    first, and documents with no non-empty value are left out.
+    """
+    values = df[col].str.strip()
+    mask = values.notna() & values.ne("")
+
+    candidates = pd.DataFrame({"doc_id": df["doc_id"], "value": values})[mask]
+    candidates["pos"] = candidates.index
+
+    stats = (
+        candidates
+        .groupby(["doc_id", "value"], sort=False)
+        .agg(n=("pos", "size"), first=("pos", "min"))
+        .reset_index()
+        .sort_values(["n", "first"], ascending=[False, True])
+    )
+    return stats.drop_duplicates("doc_id").set_index("doc_id")["value"]
+
+
+def reduce_extractions_for_corpus(
+    all_chunks_df: pd.DataFrame,
+    max_summary_chars: int = 800,
+) -> pd.DataFrame:
+    """
+    Reduce chunk-level extractions for many documents in a single pass.
+
+    This gives the same result as calling reduce_extractions_for_document
+    once per document, but does the grouping in pandas instead of a
+    Python loop over documents.
+
+    Parameters
+    ----------
+    all_chunks_df : pd.DataFrame
+        One row per valid chunk extraction, with columns:
+        doc_id, entity_name, region, sector, risk_type, time_horizon,
+        key_risk_factors, risk_summary. Every row must have a doc_id.
+
+    max_summary_chars : int, optional
+        Maximum length of each merged risk_summary. Default is 800.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per doc_id, in order of first appearance, with the
+        document-level schema fields as columns.
+
+    Raises
+    ------
+    ValueError
+        If any row has a missing doc_id, since groupby would otherwise
+        drop it silently.
+    """
+    df = all_chunks_df.reset_index(drop=True)
+
+    if df["doc_id"].isna().any():
+        raise ValueError("all_chunks_df has rows with a missing doc_id")
+
+    doc_ids = pd.Index(df["doc_id"].unique(), name="doc_id")
+    result = pd.DataFrame(index=doc_ids)
+
+    # Aggregate categorical fields using a simple majority vote
+    for col in ("entity_name", "region", "sector", "risk_type", "time_horizon"):
+        result[col] = _most_frequent_per_doc(df, col).reindex(doc_ids, fill_value="")
+
+    # Map controlled vocab fields to their canonical values, falling back
+    # to the same defaults as the per-document reducer
+    for col, canon, default in (
+        ("risk_type", _RISK_TYPE_CANON, "other"),
+        ("region", _REGION_CANON, "global"),
+        ("time_horizon", _TIME_HORIZON_CANON, "not_specified"),
+    ):
+        result[col] = result[col].str.lower().map(canon).fillna(default)
+
+    # Merge risk factors, deduplicating case-insensitively per document
+    # Non-list values are skipped, as in _merge_lists_unique
+    is_list = df["key_risk_factors"].map(lambda v: isinstance(v, list))
+    factors = df.loc[is_list, ["doc_id", "key_risk_factors"]].explode("key_risk_factors")
+    cleaned_factors = factors["key_risk_factors"].str.strip()
+    factors = factors.assign(key_risk_factors=cleaned_factors)[
+        cleaned_factors.notna() & cleaned_factors.ne("")
+    ]
+    factors["key_lower"] = factors["key_risk_factors"].str.lower()
+    merged_factors = (
+        factors
+        .drop_duplicates(["doc_id", "key_lower"])
+        .groupby("doc_id", sort=False)["key_risk_factors"]
+        .agg(list)
+        .reindex(doc_ids)
+    )
+    result["key_risk_factors"] = [v if isinstance(v, list) else [] for v in merged_factors]
+
+    # Concatenate summaries and truncate long ones
+    summaries = df["risk_summary"].str.strip()
+    mask = summaries.notna() & summaries.ne("")
+    combined = (
+        summaries[mask]
+        .groupby(df.loc[mask, "doc_id"], sort=False)
+        .agg(" ".join)
+        .reindex(doc_ids, fill_value="")
+    )
+    too_long = combined.str.len() > max_summary_chars
+    combined[too_long] = combined[too_long].str[:max_summary_chars].str.rstrip() + " ..."
+    result["risk_summary"] = combined
+
+    return result.reset_index()
@@ -57,6 +57,19 @@ ALLOWED_TIME_HORIZONS: List[str] = [
     "not_specified",
 ]
 
+# Frozen copies of the vocabularies for constant time membership checks
+_ALLOWED_RISK_TYPES = frozenset(ALLOWED_RISK_TYPES)
+_ALLOWED_REGIONS = frozenset(ALLOWED_REGIONS)
+_ALLOWED_TIME_HORIZONS = frozenset(ALLOWED_TIME_HORIZONS)
+
+# (field, schema type name, python type) triples built from FIELD_SCHEMA,
+# so presence and type can be checked in a single pass
+_PYTHON_TYPES = {"string": str, "list": list}
+_CHECKS = tuple(
+    (field, expected_type, _PYTHON_TYPES[expected_type])
+    for field, expected_type in FIELD_SCHEMA.items()
+)
+
 
 # ---------------------------------------------
 # SIMPLE VALIDATION HELPER
@@ -76,40 +89,30 @@ def validate_extracted_json(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         The cleaned dictionary if valid, or None if invalid.
     """
 
-    # Check presence of all fields
-    for field, expected_type in FIELD_SCHEMA.items():
+    # Check presence and type of all fields
+    for field, expected_type, python_type in _CHECKS:
         if field not in data:
             print(f"Missing field: {field}")
             return None
 
-    # Type checks
-    for field, expected_type in FIELD_SCHEMA.items():
-        value = data[field]
-
-        if expected_type == "string":
-            if not isinstance(value, str):
-                print(f"Field {field} must be a string")
-                return None
-
-        if expected_type == "list":
-            if not isinstance(value, list):
-                print(f"Field {field} must be a list")
-                return None
+        if not isinstance(data[field], python_type):
+            print(f"Field {field} must be a {expected_type}")
+            return None
 
     # Controlled vocabulary checks
     # Empty string is allowed here, since the model may leave it blank
     risk_type = data.get("risk_type", "")
-    if risk_type and risk_type not in ALLOWED_RISK_TYPES:
+    if risk_type and risk_type not in _ALLOWED_RISK_TYPES:
         print(f"Invalid risk_type: {risk_type}")
         return None
 
     region = data.get("region", "")
-    if region and region not in ALLOWED_REGIONS:
+    if region and region not in _ALLOWED_REGIONS:
         print(f"Invalid region: {region}")
         return None
 
     time_horizon = data.get("time_horizon", "")
-    if time_horizon and time_horizon not in ALLOWED_TIME_HORIZONS:
+    if time_horizon and time_horizon not in _ALLOWED_TIME_HORIZONS:
         print(f"Invalid time_horizon: {time_horizon}")
         return None
 